@@ -28,16 +28,31 @@ SOFTWARE.
 import os
 import sys
 import time
+import threading
 import json
+import importlib
+import importlib.util
 import subprocess
 import argparse
 import re
 import random
 import shutil
+import signal
+import bisect
+import copy
+import heapq
+from array import array
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import List, Tuple, Optional, Dict
+from typing import List, Tuple, Optional, Dict, FrozenSet, Union
 from datetime import datetime
 
+# Imported on first use by get_requests() so admin commands start fast
+requests = None
+
 # VERSION INFORMATION
 CURRENT_VERSION = {
     "version": "1.0.1",
@@ -49,19 +64,42 @@ CURRENT_VERSION = {
     "last_updated": "2026-01-30"
 }
 
+VERSION_BANNER = (
+    f"Lyrics Shower v{CURRENT_VERSION['version']}\n"
+    f"Build: {CURRENT_VERSION['build']}\n"
+    f"Status: {CURRENT_VERSION['status']}\n"
+    f"Last Updated: {CURRENT_VERSION['last_updated']}\n"
+)
+
 VERSION_CHECK_URL = "https://raw.githubusercontent.com/sparxmathsalternative/termux-lyrics-shower/refs/heads/main/version.json"
 
 # ============= CONFIGURATION =============
-CONFIG_DIR = Path.home() / ".config" / "lyrics-shower"
-MUSIC_DIR = Path.home() / "Music"
-LYRICS_DIR = Path.home() / ".lyrics_cache"
+HOME = Path.home()
+CONFIG_DIR = HOME / ".config" / "lyrics-shower"
+MUSIC_DIR = HOME / "Music"
+LYRICS_DIR = HOME / ".lyrics_cache"
+LYRICS_BIN = HOME / "bin" / "lyrics"
 CONFIG_FILE = CONFIG_DIR / "config.json"
+MUSIC_INDEX_FILE = CONFIG_DIR / "music_index.json"
+DEPS_STAMP_FILE = HOME / ".cache" / "lyrics-shower" / "deps.stamp"
 
 # Create directories
 CONFIG_DIR.mkdir(parents=True, exist_ok=True)
 MUSIC_DIR.mkdir(exist_ok=True)
 LYRICS_DIR.mkdir(exist_ok=True)
 
+# Browsers yt-dlp can borrow cookies from (only the installed ones are tried)
+COOKIE_BROWSERS = ("firefox", "chrome", "chromium")
+
+# yt-dlp search prefix for each platform
+PLATFORM_SEARCH_PREFIXES = {
+    "youtube": "ytsearch1",
+    "soundcloud": "scsearch1",
+    "spotify": "spsearch1"
+}
+
+DISPLAY_MODES = ("scrolling", "centered", "list")
+
 # Default configuration
 DEFAULT_CONFIG = {
     "platform": "youtube",
@@ -82,25 +120,18 @@ DEFAULT_CONFIG = {
 
 def compare_versions(v1: dict, v2: dict) -> int:
     """Compare two version dicts. Returns: 1 if v1 > v2, -1 if v1 < v2, 0 if equal"""
-    if v1["major"] != v2["major"]:
-        return 1 if v1["major"] > v2["major"] else -1
-    if v1["minor"] != v2["minor"]:
-        return 1 if v1["minor"] > v2["minor"] else -1
-    if v1["patch"] != v2["patch"]:
-        return 1 if v1["patch"] > v2["patch"] else -1
-    if v1.get("build", 0) != v2.get("build", 0):
-        return 1 if v1.get("build", 0) > v2.get("build", 0) else -1
-    return 0
+    t1 = (v1["major"], v1["minor"], v1["patch"], v1.get("build", 0))
+    t2 = (v2["major"], v2["minor"], v2["patch"], v2.get("build", 0))
+    return (t1 > t2) - (t1 < t2)
 
 def check_version() -> Optional[str]:
     """Check version and return warning message if needed"""
     config = load_config()
-    if not config.get("check_updates", True):
+    if not config.get("check_updates", True) or get_requests() is None:
         return None
     
     try:
-        import requests
-        response = requests.get(VERSION_CHECK_URL, timeout=5)
+        response = http_session().get(VERSION_CHECK_URL, timeout=5)
         if response.status_code == 200:
             remote_version = response.json()
             
@@ -142,21 +173,61 @@ VERSION_WARNING = None
 
 # ============= UTILITY FUNCTIONS =============
 
-def load_config() -> dict:
-    """Load configuration from file"""
-    if CONFIG_FILE.exists():
+@lru_cache(maxsize=4)
+def _load_config_cached(mtime_ns: Optional[int]) -> dict:
+    """Read and parse the config file (cached per file mtime)"""
+    if mtime_ns is not None:
         with open(CONFIG_FILE, 'r') as f:
             return {**DEFAULT_CONFIG, **json.load(f)}
     return DEFAULT_CONFIG.copy()
 
+def load_config() -> dict:
+    """Load configuration from file"""
+    try:
+        mtime_ns = CONFIG_FILE.stat().st_mtime_ns
+    except FileNotFoundError:
+        mtime_ns = None
+    # Callers mutate the config, so hand out a copy of the cached one
+    return copy.deepcopy(_load_config_cached(mtime_ns))
+
 def save_config(config: dict):
     """Save configuration to file"""
     with open(CONFIG_FILE, 'w') as f:
         json.dump(config, f, indent=2)
+    _load_config_cached.cache_clear()
+
+def get_requests():
+    """Import requests on first use; returns None if it is not installed"""
+    global requests
+    if requests is None:
+        try:
+            requests = importlib.import_module("requests")
+        except ImportError:
+            return None
+    return requests
+
+_http_session = None
+
+def http_session():
+    """Shared HTTP session so repeated requests reuse connections"""
+    global _http_session
+    if _http_session is None:
+        _http_session = requests.Session()
+        _http_session.headers["User-Agent"] = f"lyrics-shower/{CURRENT_VERSION['version']}"
+    return _http_session
+
+CLEAR_SEQUENCE = b"\033[2J\033[H"
 
 def clear_screen():
     """Clear terminal screen"""
-    os.system('clear')
+    # Flush first so pending prints are not written after the clear
+    sys.stdout.flush()
+    os.write(sys.stdout.fileno(), CLEAR_SEQUENCE)
+
+@lru_cache(maxsize=32)
+def _which(cmd: str) -> Optional[str]:
+    """shutil.which, cached for the session (cleared after installs)"""
+    return shutil.which(cmd)
 
 def install_dependency(package: str, pip: bool = False):
     """Install a dependency"""
@@ -165,79 +236,256 @@ def install_dependency(package: str, pip: bool = False):
             subprocess.run([sys.executable, "-m", "pip", "install", package], 
                          check=True, capture_output=True)
         else:
-            subprocess.run(["pkg", "install", package, "-y"], 
-                         check=True, capture_output=True)
+            pkg = _which("pkg")
+            if pkg is None:
+                return False
+            # posix_spawn avoids copying our address space just to exec pkg
+            devnull = [(os.POSIX_SPAWN_OPEN, fd, os.devnull, os.O_WRONLY, 0) for fd in (1, 2)]
+            pid = os.posix_spawn(pkg, ["pkg", "install", package, "-y"], os.environ,
+                                 file_actions=devnull)
+            _, status = os.waitpid(pid, 0)
+            if os.waitstatus_to_exitcode(status) != 0:
+                return False
+        _which.cache_clear()
         return True
     except:
         return False
 
+def deps_stamp_is_fresh(player: str) -> bool:
+    """Whether the last successful dependency check still holds
+
+    Only stats the recorded tool paths instead of searching PATH again.
+    """
+    try:
+        with open(DEPS_STAMP_FILE, 'r') as f:
+            stamp = json.load(f)
+        if stamp["player"] != player or not stamp["files"]:
+            return False
+        return all(os.stat(path).st_mtime_ns == mtime_ns for path, mtime_ns in stamp["files"].items())
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return False
+
+def write_deps_stamp(player: str):
+    """Record the tool paths found by a successful dependency check"""
+    paths = [_which("yt-dlp"), _which(player)]
+    spec = importlib.util.find_spec("requests")
+    paths.append(spec.origin if spec else None)
+    if None in paths:
+        return
+    try:
+        DEPS_STAMP_FILE.parent.mkdir(parents=True, exist_ok=True)
+        files = {path: os.stat(path).st_mtime_ns for path in paths}
+        with open(DEPS_STAMP_FILE, 'w') as f:
+            json.dump({"player": player, "files": files}, f)
+    except OSError:
+        pass
+
+# Media player whose dependencies were all found present, if any
+_deps_ok_player: Optional[str] = None
+
 def check_dependencies():
     """Check and install required dependencies"""
+    global _deps_ok_player
     config = load_config()
+    player = config["media_player"]
+    if _deps_ok_player == player or deps_stamp_is_fresh(player):
+        _deps_ok_player = player
+        return
+    all_present = True
     
     # Check for yt-dlp
-    if shutil.which("yt-dlp") is None:
+    if _which("yt-dlp") is None:
+        all_present = False
         print("📦 Installing yt-dlp...")
         if config["auto_install"]:
             install_dependency("yt-dlp", pip=True)
     
     # Check for ffplay/mpv
-    player = config["media_player"]
-    if shutil.which(player) is None:
+    if _which(player) is None:
+        all_present = False
         print(f"📦 Installing {player}...")
         if config["auto_install"]:
             install_dependency("ffmpeg" if player == "ffplay" else player)
     
-    # Check for requests
-    try:
-        import requests
-    except ImportError:
+    # Check for requests (without importing it yet)
+    if requests is None and importlib.util.find_spec("requests") is None:
+        all_present = False
         print("📦 Installing requests...")
         install_dependency("requests", pip=True)
-
-def fuzzy_search(query: str, items: List[str], threshold: float = 0.6) -> List[Tuple[str, float]]:
-    """Simple fuzzy search implementation"""
-    query = query.lower()
-    results = []
+        importlib.invalidate_caches()
     
+    if all_present:
+        _deps_ok_player = player
+        write_deps_stamp(player)
+
+# Fold common accented letters to ASCII so "beyonce" finds "Beyoncé"
+ASCII_FOLD = str.maketrans('áàâäãåéèêëíìîïóòôöõúùûüñç', 'aaaaaaeeeeiiiiooooouuuunc')
+
+def normalize(text: str) -> str:
+    """Lowercase and accent-fold text for fuzzy matching"""
+    return text.lower().translate(ASCII_FOLD)
+
+def title_key(song_title: str) -> str:
+    """Normalized, interned lookup key for a song title"""
+    return sys.intern(normalize(song_title).strip())
+
+def prepare_corpus(items: List[str], normalized: bool = False) -> List[Tuple[str, str, FrozenSet[str]]]:
+    """Precompute (original, normalized, word set) for fuzzy searching
+
+    Pass normalized=True when items already went through normalize().
+    """
+    corpus = []
     for item in items:
-        item_lower = item.lower()
-        
-        # Exact match
-        if query == item_lower:
-            results.append((item, 1.0))
-            continue
-        
-        # Substring match
-        if query in item_lower:
-            score = len(query) / len(item_lower)
-            results.append((item, score))
-            continue
-        
-        # Word match
-        query_words = set(query.split())
-        item_words = set(item_lower.split())
-        if query_words & item_words:
-            score = len(query_words & item_words) / len(query_words | item_words)
-            if score >= threshold:
-                results.append((item, score))
+        item_lower = item if normalized else normalize(item)
+        corpus.append((item, item_lower, frozenset(item_lower.split())))
+    return corpus
+
+# Corpora of cached file names, keyed by source and rebuilt when its mtime changes.
+# Reusing the same corpus object is what lets the fuzzy cache below hit.
+_corpus_cache: Dict[object, Tuple[int, list]] = {}
+
+# Recent (unranked) fuzzy_search results for the current corpus, keyed by (query, threshold)
+FUZZY_CACHE_SIZE = 32
+_fuzzy_cache: "OrderedDict[Tuple[str, float], Tuple[list, List[Tuple[str, float]]]]" = OrderedDict()
+_fuzzy_cache_source = None
+
+def cached_corpus(source, mtime_ns: int, items, normalized: bool = False) -> List[Tuple[str, str, FrozenSet[str]]]:
+    """prepare_corpus() for a file listing, reused while its mtime is unchanged
+
+    source identifies the corpus: a cache directory for its file stems,
+    or ("index", MUSIC_DIR) for the normalized music index keys. items is
+    a callable returning the names, only called on a rebuild.
+    """
+    hit = _corpus_cache.get(source)
+    if hit is not None and hit[0] == mtime_ns:
+        return hit[1]
+    corpus = prepare_corpus(items(), normalized=normalized)
+    _corpus_cache[source] = (mtime_ns, corpus)
+    return corpus
+
+# Successful lyrics fetches and downloads from this session, most recent last.
+# Only hits are stored so a failed network call is retried next time.
+SESSION_CACHE_SIZE = 128
+_lyrics_cache: "OrderedDict[tuple, str]" = OrderedDict()
+_download_cache: "OrderedDict[tuple, str]" = OrderedDict()
+
+def session_cache_get(cache: OrderedDict, key: tuple) -> Optional[str]:
+    """Look up a session cache entry, marking it as recently used"""
+    value = cache.get(key)
+    if value is not None:
+        cache.move_to_end(key)
+    return value
+
+def session_cache_put(cache: OrderedDict, key: tuple, value: str):
+    """Store a session cache entry, evicting the least recently used"""
+    cache[key] = value
+    cache.move_to_end(key)
+    if len(cache) > SESSION_CACHE_SIZE:
+        cache.popitem(last=False)
+
+def clear_fuzzy_cache():
+    """Forget cached corpora and fuzzy_search results"""
+    global _fuzzy_cache_source
+    _corpus_cache.clear()
+    _fuzzy_cache.clear()
+    _fuzzy_cache_source = None
+
+def rank_matches(results: List[Tuple[str, float]], top_k: Optional[int] = None) -> List[Tuple[str, float]]:
+    """Order matches by score, keeping only the best top_k if given"""
+    if top_k is not None:
+        return heapq.nlargest(top_k, results, key=itemgetter(1))
+    return sorted(results, key=itemgetter(1), reverse=True)
+
+def fuzzy_search(query: str, items: Union[List[str], List[Tuple[str, str, FrozenSet[str]]]],
+                 threshold: float = 0.6, top_k: Optional[int] = None,
+                 normalized: bool = False) -> List[Tuple[str, float]]:
+    """Simple fuzzy search implementation
+
+    items may be raw strings or a corpus built by prepare_corpus().
+    With top_k, only the best top_k matches are returned. Pass
+    normalized=True when the query already went through normalize().
+    """
+    global _fuzzy_cache_source
+    if not normalized:
+        query = normalize(query)
+    query_words = frozenset(query.split())
+    
+    if items is not _fuzzy_cache_source:
+        _fuzzy_cache.clear()
+        _fuzzy_cache_source = items
+    
+    key = (query, threshold)
+    if key in _fuzzy_cache:
+        _fuzzy_cache.move_to_end(key)
+        return rank_matches(_fuzzy_cache[key][1], top_k)
+    
+    corpus = prepare_corpus(items) if items and isinstance(items[0], str) else items
+    
+    # A single-word query only matches items containing it, and those also
+    # contain any prefix of it, so narrow the scan to a cached prefix's hits
+    if query.split() == [query]:
+        for prev_query, prev_threshold in reversed(_fuzzy_cache):
+            if prev_threshold == threshold and query.startswith(prev_query):
+                corpus = _fuzzy_cache[(prev_query, prev_threshold)][0]
+                break
     
-    return sorted(results, key=lambda x: x[1], reverse=True)
+    # Exact/substring match (an exact match scores 1.0)
+    matched = [entry for entry in corpus if query in entry[1]]
+    results = [(item, len(query) / len(item_lower) if item_lower else 1.0)
+               for item, item_lower, _ in matched]
+    
+    # Word match, only needed when nothing contains the query outright
+    if not matched:
+        for entry in corpus:
+            item, _, item_words = entry
+            common = query_words & item_words
+            if common:
+                score = len(common) / len(query_words | item_words)
+                if score >= threshold:
+                    results.append((item, score))
+                    matched.append(entry)
+    
+    _fuzzy_cache[key] = (matched, results)
+    if len(_fuzzy_cache) > FUZZY_CACHE_SIZE:
+        _fuzzy_cache.popitem(last=False)
+    return rank_matches(results, top_k)
 
 # ============= LYRICS FUNCTIONS =============
 
+# One timed LRC line: [mm:ss.xx] text. A third [mm:ss:xx] field is
+# accepted but, as before, does not count towards the timestamp.
+LRC_LINE_RE = re.compile(r'^[^\S\n]*\[(\d+):(\d+(?:\.\d+)?)(?::\d+(?:\.\d+)?)?\][^\S\n]*(.*?\S)[^\S\n]*$', re.M)
+
 def fetch_lyrics_from_url(url: str) -> Optional[str]:
     """Fetch lyrics from custom URL"""
+    if get_requests() is None:
+        return None
+    
     try:
-        import requests
-        response = requests.get(url, timeout=10)
+        response = http_session().get(url, timeout=10)
         if response.status_code == 200:
             return response.text
     except:
         pass
     return None
 
-def fetch_lyrics(song_title: str, artist: str = "", custom_url: str = None) -> Optional[str]:
+def fetch_lyrics(song_title: str, artist: str = "", custom_url: str = None,
+                 normalized: Optional[str] = None) -> Optional[str]:
+    """Fetch synced lyrics, reusing any found earlier in this session
+
+    normalized is song_title's title_key(), if the caller already has it.
+    """
+    if normalized is None:
+        normalized = title_key(song_title)
+    key = (normalized, artist.strip().lower(), custom_url)
+    lyrics = session_cache_get(_lyrics_cache, key)
+    if lyrics is None:
+        lyrics = _fetch_lyrics_uncached(song_title, artist, custom_url)
+        if lyrics:
+            session_cache_put(_lyrics_cache, key, lyrics)
+    return lyrics
+
+def _fetch_lyrics_uncached(song_title: str, artist: str = "", custom_url: str = None) -> Optional[str]:
     """Fetch synced lyrics from various sources"""
     if custom_url:
         print(f"📝 Fetching lyrics from custom URL...")
@@ -247,12 +495,14 @@ def fetch_lyrics(song_title: str, artist: str = "", custom_url: str = None) -> O
     
     print(f"📝 Fetching lyrics for: {song_title}")
     
+    if get_requests() is None:
+        print("⚠️  Failed to fetch lyrics: requests is not installed")
+        return None
+    
     try:
-        import requests
-        
         # Try LRCLIB API
         search_query = f"{artist} {song_title}".strip()
-        response = requests.get(
+        response = http_session().get(
             "https://lrclib.net/api/search",
             params={"q": search_query},
             timeout=10
@@ -275,29 +525,10 @@ def fetch_lyrics(song_title: str, artist: str = "", custom_url: str = None) -> O
 
 def parse_lrc(lrc_content: str) -> List[Tuple[float, str]]:
     """Parse LRC format lyrics"""
-    lyrics = []
-    for line in lrc_content.split('\n'):
-        line = line.strip()
-        if line.startswith('[') and ']' in line:
-            try:
-                time_str = line[1:line.index(']')]
-                text = line[line.index(']')+1:].strip()
-                
-                # Skip metadata
-                if not text or time_str[0].isalpha():
-                    continue
-                
-                # Parse time [mm:ss.xx]
-                if ':' in time_str:
-                    parts = time_str.split(':')
-                    minutes = float(parts[0])
-                    seconds = float(parts[1])
-                    timestamp = minutes * 60 + seconds
-                    lyrics.append((timestamp, text))
-            except:
-                continue
-    
-    return sorted(lyrics, key=lambda x: x[0])
+    # Metadata tags like [ar:...] fail the digit match and are skipped
+    lyrics = [(int(m[1]) * 60 + float(m[2]), m[3]) for m in LRC_LINE_RE.finditer(lrc_content)]
+    lyrics.sort(key=itemgetter(0))
+    return lyrics
 
 def save_lyrics(song_title: str, lyrics: str):
     """Save lyrics to cache"""
@@ -316,10 +547,104 @@ def load_cached_lyrics(song_title: str) -> Optional[str]:
 
 # ============= MUSIC FUNCTIONS =============
 
-def download_music(query: str, custom_url: str = None) -> Optional[str]:
+_music_index: Optional[Dict[str, str]] = None
+_music_index_mtime: Optional[int] = None
+
+def save_music_index(files: Dict[str, str], dir_mtime_ns: int):
+    """Persist the music index along with the MUSIC_DIR mtime it matches"""
+    global _music_index, _music_index_mtime
+    _music_index, _music_index_mtime = files, dir_mtime_ns
+    try:
+        with open(MUSIC_INDEX_FILE, 'w') as f:
+            json.dump({"dir_mtime_ns": dir_mtime_ns, "files": files}, f)
+    except OSError:
+        pass  # The in-memory index still works
+
+def load_music_index(rebuild: bool = False) -> Dict[str, str]:
+    """Map normalized song names to cached mp3 file names
+
+    Rebuilt from a directory listing only when MUSIC_DIR has changed
+    (or when rebuild is set).
+    """
+    global _music_index, _music_index_mtime
+    dir_mtime_ns = MUSIC_DIR.stat().st_mtime_ns
+    if not rebuild and _music_index is not None and _music_index_mtime == dir_mtime_ns:
+        return _music_index
+    
+    if not rebuild:
+        try:
+            with open(MUSIC_INDEX_FILE, 'r') as f:
+                data = json.load(f)
+            if data["dir_mtime_ns"] == dir_mtime_ns:
+                _music_index, _music_index_mtime = data["files"], dir_mtime_ns
+                return _music_index
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+    
+    with os.scandir(MUSIC_DIR) as it:
+        files = {normalize(entry.name[:-4]): entry.name for entry in it
+                 if entry.name.endswith(".mp3") and entry.is_file()}
+    save_music_index(files, dir_mtime_ns)
+    return files
+
+def index_music_file(filepath: str, dir_mtime_before: int):
+    """Add a freshly downloaded file to the music index
+
+    dir_mtime_before is the MUSIC_DIR mtime from before the download; the
+    entry is only added in place if the index was up to date at that point.
+    """
+    path = Path(filepath)
+    if (_music_index is None or _music_index_mtime != dir_mtime_before
+            or path.suffix != ".mp3" or path.parent != MUSIC_DIR):
+        load_music_index()
+        return
+    files = dict(_music_index)
+    files[normalize(path.stem)] = path.name
+    save_music_index(files, MUSIC_DIR.stat().st_mtime_ns)
+
+def find_cached_music(song_title: str, normalized: Optional[str] = None) -> Optional[Path]:
+    """Find a cached mp3 for a title: exact index hit first, then fuzzy"""
+    if normalized is None:
+        normalized = title_key(song_title)
+    index = load_music_index()
+    name = index.get(normalized)
+    if name is not None:
+        audio_file = MUSIC_DIR / name
+        # Coarse-mtime filesystems can hide a deletion from the index check
+        if audio_file.exists():
+            return audio_file
+        index = load_music_index(rebuild=True)
+        clear_fuzzy_cache()
+    
+    corpus = cached_corpus(("index", MUSIC_DIR), _music_index_mtime, lambda: list(index), normalized=True)
+    matches = fuzzy_search(normalized, corpus, top_k=1, normalized=True)
+    if matches:
+        return MUSIC_DIR / index[matches[0][0]]
+    return None
+
+def download_music(query: str, custom_url: str = None, normalized: Optional[str] = None) -> Optional[str]:
+    """Download music, reusing a file downloaded earlier in this session
+
+    normalized is the query's title_key(), if the caller already has it.
+    """
+    if normalized is None:
+        normalized = title_key(sanitize_title(query))
+    key = (normalized, custom_url)
+    filepath = session_cache_get(_download_cache, key)
+    if filepath is not None and os.path.exists(filepath):
+        print(f"✅ Already downloaded: {filepath}")
+        return filepath
+    
+    filepath = _download_music_uncached(query, custom_url)
+    if filepath:
+        session_cache_put(_download_cache, key, filepath)
+    return filepath
+
+def _download_music_uncached(query: str, custom_url: str = None) -> Optional[str]:
     """Download music using yt-dlp"""
     print(f"🔍 Searching for: {query}")
     
+    dir_mtime_before = MUSIC_DIR.stat().st_mtime_ns
     output_template = str(MUSIC_DIR / "%(title)s.%(ext)s")
     
     if custom_url:
@@ -328,15 +653,8 @@ def download_music(query: str, custom_url: str = None) -> Optional[str]:
         config = load_config()
         platform = config["platform"]
         
-        # Map platform to search format
-        if platform == "youtube":
-            url = f"ytsearch1:{query}"
-        elif platform == "soundcloud":
-            url = f"scsearch1:{query}"
-        elif platform == "spotify":
-            url = f"spsearch1:{query}"
-        else:
-            url = f"ytsearch1:{query}"  # Default to YouTube
+        # Map platform to search format (default to YouTube)
+        url = f"{PLATFORM_SEARCH_PREFIXES.get(platform, 'ytsearch1')}:{query}"
     
     # Base command
     base_cmd = [
@@ -349,29 +667,32 @@ def download_music(query: str, custom_url: str = None) -> Optional[str]:
         "--print", "after_move:filepath"
     ]
     
-    # Try with cookies from common browsers
-    browsers = ["firefox", "chrome", "chromium"]
-    
-    for browser in browsers:
+    # Try with cookies from the browsers that are actually installed
+    for browser in [b for b in COOKIE_BROWSERS if _which(b)]:
         try:
-            cmd = base_cmd.copy()
-            cmd.insert(-1, "--cookies-from-browser")
-            cmd.insert(-1, browser)
-            cmd.append(url)
+            # Keep "--print after_move:filepath" together at the end
+            cmd = base_cmd[:-2] + ["--cookies-from-browser", browser] + base_cmd[-2:] + [url]
             
             result = subprocess.run(cmd, capture_output=True, text=True, check=True)
             filepath = result.stdout.strip().split('\n')[-1]
             print(f"✅ Downloaded: {filepath}")
+            index_music_file(filepath, dir_mtime_before)
             return filepath
-        except:
-            continue
+        except subprocess.CalledProcessError as e:
+            # Another browser only helps if this one had no usable cookies
+            if "cookie" not in (e.stderr or "").lower():
+                break
+        except OSError:
+            break
     
     # If cookies don't work, try without
     try:
         cmd = base_cmd + [url]
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+        result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                                text=True, check=True)
         filepath = result.stdout.strip().split('\n')[-1]
         print(f"✅ Downloaded: {filepath}")
+        index_music_file(filepath, dir_mtime_before)
         return filepath
     except subprocess.CalledProcessError as e:
         print(f"❌ Failed to download: {e}")
@@ -383,88 +704,99 @@ def download_music(query: str, custom_url: str = None) -> Optional[str]:
 
 # ============= DISPLAY FUNCTIONS =============
 
+# Combining marks stacked onto glitched characters
+GLITCH_CHARS = ('̴', '̵', '̶', '̷', '̸', '̡', '̢', '̧', '̨', '̛', '̖', '̗', '̘', '̙', '̜', '̝', '̞', '̟')
+
 def apply_glitch_effect(text: str) -> str:
     """Apply unicode glitch effect to text"""
-    glitch_chars = ['̴', '̵', '̶', '̷', '̸', '̡', '̢', '̧', '̨', '̛', '̖', '̗', '̘', '̙', '̜', '̝', '̞', '̟']
-    result = []
-    for char in text:
-        if random.random() < 0.3:
-            result.append(char + random.choice(glitch_chars))
-        else:
-            result.append(char)
-    return ''.join(result)
+    # One random byte per character; below 77 (~30% of 256) gets a mark
+    mask = random.randbytes(len(text))
+    picks = random.choices(GLITCH_CHARS, k=len(text))
+    return ''.join(char + pick if m < 77 else char for char, pick, m in zip(text, picks, mask))
+
+# Line templates used by the display modes
+CURRENT_LINE_CYAN = "  \033[1;96m► {}\033[0m"
+CURRENT_LINE_WHITE = "  \033[1;97m► {}\033[0m"
+CONTEXT_LINE_GRAY = "    \033[90m{}\033[0m"
+LIST_LINE = "    {}"
+CENTERED_CYAN = "{}\033[1;96m{}\033[0m"
+CENTERED_WHITE = "{}\033[1;97m{}\033[0m"
+TIMER_LINE = "⏱️  {:02d}:{:02d}"
+RULE = "=" * 60
+
+def write_frame(lines: List[str]):
+    """Redraw the screen in place with a single write"""
+    # Home the cursor, erase each line's leftovers, then erase below the frame
+    frame = "\033[H" + "\033[K\n".join(lines) + "\033[K\n\033[J"
+    sys.stdout.write(frame)
+    sys.stdout.flush()
 
 def display_scrolling(lyrics: List[Tuple[float, str]], elapsed: float, current_line: int, config: dict):
     """Display scrolling lyrics"""
-    clear_screen()
-    print("=" * 60)
-    print(f"🎵 NOW PLAYING")
-    print("=" * 60)
-    print("\n")
+    effects = config["effects"]
+    glitch = effects["glitch"]
+    flash = effects["flash"]
+    current_template = CURRENT_LINE_WHITE if flash else CURRENT_LINE_CYAN
+    lines = [RULE, "🎵 NOW PLAYING", RULE, "", ""]
     
     # Show context lines
     for i in range(max(0, current_line - 1), min(len(lyrics), current_line + 4)):
         timestamp, text = lyrics[i]
         
-        if config["effects"]["glitch"] and i == current_line:
+        if glitch and i == current_line:
             text = apply_glitch_effect(text)
         
         if i == current_line:
-            if config["effects"]["flash"]:
-                print(f"\n  \033[1;97m► {text}\033[0m\n")  # White/bright
-            else:
-                print(f"\n  \033[1;96m► {text}\033[0m\n")  # Cyan
+            lines += ["", current_template.format(text), ""]
         else:
-            print(f"    \033[90m{text}\033[0m")  # Gray
+            lines.append(CONTEXT_LINE_GRAY.format(text))
     
-    print("\n" * 5)
-    print(f"⏱️  {int(elapsed//60):02d}:{int(elapsed%60):02d}")
-    print("\n[Ctrl+C to stop]")
+    lines += [""] * 6
+    lines.append(TIMER_LINE.format(int(elapsed//60), int(elapsed%60)))
+    lines += ["", "[Ctrl+C to stop]"]
+    write_frame(lines)
 
-def display_centered(lyrics: List[Tuple[float, str]], elapsed: float, current_line: int, config: dict):
+def display_centered(lyrics: List[Tuple[float, str]], elapsed: float, current_line: int, config: dict,
+                     term_width: Optional[int] = None):
     """Display only current line centered"""
-    clear_screen()
+    effects = config["effects"]
+    glitch = effects["glitch"]
+    flash = effects["flash"]
+    if term_width is None:
+        term_width = shutil.get_terminal_size().columns
     
     # Center vertically
-    for _ in range(10):
-        print()
+    lines = [""] * 10
     
     if current_line < len(lyrics):
         _, text = lyrics[current_line]
         
-        if config["effects"]["glitch"]:
+        if glitch:
             text = apply_glitch_effect(text)
         
         # Center horizontally
-        term_width = shutil.get_terminal_size().columns
         padding = (term_width - len(text)) // 2
         
-        if config["effects"]["flash"]:
-            print(" " * padding + f"\033[1;97m{text}\033[0m")
-        else:
-            print(" " * padding + f"\033[1;96m{text}\033[0m")
+        centered_template = CENTERED_WHITE if flash else CENTERED_CYAN
+        lines.append(centered_template.format(" " * padding, text))
     
     # More vertical spacing
-    for _ in range(10):
-        print()
-    
-    print(f"\n⏱️  {int(elapsed//60):02d}:{int(elapsed%60):02d}")
+    lines += [""] * 11
+    lines.append(TIMER_LINE.format(int(elapsed//60), int(elapsed%60)))
+    write_frame(lines)
 
 def display_list(lyrics: List[Tuple[float, str]], elapsed: float, current_line: int, config: dict):
     """Display all lyrics as a list"""
-    clear_screen()
-    print("=" * 60)
-    print(f"🎵 LYRICS")
-    print("=" * 60)
-    print()
+    lines = [RULE, "🎵 LYRICS", RULE, ""]
     
     for i, (timestamp, text) in enumerate(lyrics):
         if i == current_line:
-            print(f"  \033[1;96m► {text}\033[0m")
+            lines.append(CURRENT_LINE_CYAN.format(text))
         else:
-            print(f"    {text}")
+            lines.append(LIST_LINE.format(text))
     
-    print(f"\n⏱️  {int(elapsed//60):02d}:{int(elapsed%60):02d}")
+    lines += ["", TIMER_LINE.format(int(elapsed//60), int(elapsed%60))]
+    write_frame(lines)
 
 def showcase_lyrics(lyrics_content: str):
     """Display lyrics without playing music"""
@@ -506,31 +838,59 @@ def play_with_lyrics(audio_file: str, lyrics: List[Tuple[float, str]], config: d
         stderr=subprocess.DEVNULL
     )
     
+    # Timestamps as a packed array of doubles, searched with bisect each tick
+    timestamps = array('d', (t for t, _ in lyrics))
     start_time = time.time()
     current_line = 0
+    prev_line = None
+    prev_sec = None
+    term_width = shutil.get_terminal_size().columns
+    
+    # Only re-query the terminal size when it actually changes
+    def on_resize(signum, frame):
+        nonlocal term_width, prev_line
+        term_width = shutil.get_terminal_size().columns
+        prev_line = None  # force a redraw
+    
+    old_resize_handler = None
+    if hasattr(signal, "SIGWINCH"):
+        old_resize_handler = signal.signal(signal.SIGWINCH, on_resize)
+    
+    # Clear once; frames are redrawn in place from here on
+    clear_screen()
     
     try:
         while player_process.poll() is None:
             elapsed = time.time() - start_time
             
             # Find current lyric line
-            while (current_line < len(lyrics) - 1 and 
-                   elapsed >= lyrics[current_line + 1][0]):
-                current_line += 1
+            current_line = max(0, bisect.bisect_right(timestamps, elapsed) - 1)
             
-            # Display based on mode
-            if display_mode == "scrolling":
-                display_scrolling(lyrics, elapsed, current_line, config)
-            elif display_mode == "centered":
-                display_centered(lyrics, elapsed, current_line, config)
-            elif display_mode == "list":
-                display_list(lyrics, elapsed, current_line, config)
+            # Skip the frame if neither the line nor the timer changed
+            sec = int(elapsed)
+            if current_line != prev_line or sec != prev_sec:
+                prev_line, prev_sec = current_line, sec
+                
+                # Display based on mode
+                if display_mode == "scrolling":
+                    display_scrolling(lyrics, elapsed, current_line, config)
+                elif display_mode == "centered":
+                    display_centered(lyrics, elapsed, current_line, config, term_width)
+                elif display_mode == "list":
+                    display_list(lyrics, elapsed, current_line, config)
             
-            time.sleep(0.1)
+            # Sleep until the next lyric line or the next timer tick
+            wake_at = sec + 1
+            if current_line + 1 < len(timestamps):
+                wake_at = min(wake_at, timestamps[current_line + 1])
+            time.sleep(max(0.05, wake_at - elapsed))
             
     except KeyboardInterrupt:
         print("\n\n⏹️  Stopped")
         player_process.kill()
+    finally:
+        if old_resize_handler is not None:
+            signal.signal(signal.SIGWINCH, old_resize_handler)
 
 def play_music_only(audio_file: str, config: dict):
     """Play audio without lyrics"""
@@ -557,20 +917,22 @@ def list_cached():
     """List cached music and lyrics"""
     print("\n📁 CACHED MUSIC:")
     print("=" * 60)
-    music_files = list(MUSIC_DIR.glob("*.mp3"))
+    with os.scandir(MUSIC_DIR) as it:
+        music_files = [entry for entry in it if entry.name.endswith(".mp3")]
     if music_files:
-        for i, file in enumerate(music_files, 1):
-            size = file.stat().st_size / (1024 * 1024)
-            print(f"  {i}. {file.stem} ({size:.2f} MB)")
+        for i, entry in enumerate(music_files, 1):
+            size = entry.stat().st_size / (1024 * 1024)
+            print(f"  {i}. {entry.name[:-4]} ({size:.2f} MB)")
     else:
         print("  No cached music found")
     
     print("\n📝 CACHED LYRICS:")
     print("=" * 60)
-    lyrics_files = list(LYRICS_DIR.glob("*.lrc"))
-    if lyrics_files:
-        for i, file in enumerate(lyrics_files, 1):
-            print(f"  {i}. {file.stem}")
+    with os.scandir(LYRICS_DIR) as it:
+        lyrics_names = [entry.name[:-4] for entry in it if entry.name.endswith(".lrc")]
+    if lyrics_names:
+        for i, name in enumerate(lyrics_names, 1):
+            print(f"  {i}. {name}")
     else:
         print("  No cached lyrics found")
     print()
@@ -594,15 +956,15 @@ def clear_cache(cache_type: str, query: str = None):
     
     if query:
         # Fuzzy search
-        file_names = [f.stem for f in files]
-        matches = fuzzy_search(query, file_names)
+        corpus = cached_corpus(cache_dir, cache_dir.stat().st_mtime_ns, lambda: [f.stem for f in files])
+        matches = fuzzy_search(query, corpus, top_k=5)
         
         if not matches:
             print(f"No matches found for '{query}'")
             return
         
         print(f"\n🔍 Found matches for '{query}':")
-        for i, (name, score) in enumerate(matches[:5], 1):
+        for i, (name, score) in enumerate(matches, 1):
             print(f"  {i}. {name} (match: {score:.0%})")
         
         choice = input("\nSelect number to delete (or 'q' to cancel): ").strip()
@@ -617,6 +979,7 @@ def clear_cache(cache_type: str, query: str = None):
                 confirm = input(f"Delete '{matches[idx][0]}'? (y/N): ").strip().lower()
                 if confirm == 'y':
                     file_to_delete.unlink()
+                    clear_fuzzy_cache()
                     print(f"✅ Deleted: {matches[idx][0]}")
                 else:
                     print("Cancelled")
@@ -628,6 +991,7 @@ def clear_cache(cache_type: str, query: str = None):
         if confirm == 'y':
             for file in files:
                 file.unlink()
+            clear_fuzzy_cache()
             print(f"✅ Deleted {len(files)} {name} file(s)")
         else:
             print("Cancelled")
@@ -670,14 +1034,14 @@ def settings_menu():
             player = input("Enter player: ").strip()
             if player:
                 config['media_player'] = player
-                if shutil.which(player) is None:
+                if _which(player) is None:
                     install = input(f"{player} not found. Install? (y/N): ").strip().lower()
                     if install == 'y':
                         install_dependency("ffmpeg" if player == "ffplay" else player)
         elif choice == '3':
             print("\nDisplay modes: scrolling, centered, list")
             mode = input("Enter mode: ").strip()
-            if mode in ['scrolling', 'centered', 'list']:
+            if mode in DISPLAY_MODES:
                 config['display_mode'] = mode
         elif choice == '4':
             config['use_graph'] = not config['use_graph']
@@ -705,7 +1069,7 @@ def uninstall():
     confirm = input("Are you sure you want to uninstall? (yes/N): ").strip().lower()
     
     if confirm == 'yes':
-        script_path = Path.home() / "bin" / "lyrics"
+        script_path = LYRICS_BIN
         if script_path.exists():
             script_path.unlink()
             print("✅ Uninstalled successfully!")
@@ -727,11 +1091,14 @@ def update_lyrics_shower():
     print()
     
     # Download update script
-    update_script = Path.home() / ".lyrics_update.sh"
+    update_script = HOME / ".lyrics_update.sh"
+    
+    if get_requests() is None:
+        print("❌ Update failed: requests is not installed")
+        return
     
     try:
-        import requests
-        response = requests.get("https://raw.githubusercontent.com/sparxmathsalternative/termux-lyrics-shower/refs/heads/main/update.sh", timeout=10)
+        response = http_session().get("https://raw.githubusercontent.com/sparxmathsalternative/termux-lyrics-shower/refs/heads/main/update.sh", timeout=10)
         if response.status_code == 200:
             with open(update_script, 'w') as f:
                 f.write(response.text)
@@ -745,10 +1112,103 @@ def update_lyrics_shower():
     except Exception as e:
         print(f"❌ Update failed: {e}")
 
+# ============= COMMANDS =============
+
+# Characters that can't appear in cached file names
+TITLE_TRANSLATION = str.maketrans({'/': '-', '\\': '-'})
+
+def sanitize_title(query: str) -> str:
+    """Turn a search query into a cache-safe song title"""
+    return query.translate(TITLE_TRANSLATION)
+
+def derive_lrc_url(external_url: Optional[str]) -> Optional[str]:
+    """Guess the .lrc URL that sits next to an external music URL"""
+    if not external_url:
+        return None
+    if external_url.endswith('.lrc'):
+        return external_url
+    # Only swap an extension in the last path segment, not a dot in the host
+    dot = external_url.rfind('.')
+    if dot > external_url.rfind('/'):
+        return external_url[:dot] + '.lrc'
+    return external_url + '.lrc'
+
+def run_lyrics(query: str, config: dict, showcase: bool = False, lyrics_url: str = None):
+    """Fetch (or load cached) lyrics, optionally showing them"""
+    song_title = sanitize_title(query)
+    lyrics_content = load_cached_lyrics(song_title)
+    if not lyrics_content:
+        lyrics_content = fetch_lyrics(query, custom_url=lyrics_url, normalized=title_key(song_title))
+        if lyrics_content:
+            save_lyrics(song_title, lyrics_content)
+    
+    if lyrics_content:
+        if showcase:
+            showcase_lyrics(lyrics_content)
+        else:
+            print("✅ Lyrics fetched and cached")
+    else:
+        print("❌ No lyrics found")
+
+def run_download(query: str, config: dict, music_url: str = None):
+    """Download music only and cache it"""
+    audio_file = download_music(query, custom_url=music_url)
+    if audio_file:
+        print("✅ Music downloaded and cached")
+
+def run_play_music_only(query: str, config: dict, music_url: str = None):
+    """Play cached (or freshly downloaded) music without lyrics"""
+    song_title = sanitize_title(query)
+    key = title_key(song_title)
+    
+    # Check for cached music first
+    audio_file = find_cached_music(song_title, normalized=key)
+    if audio_file is None:
+        audio_file = download_music(query, custom_url=music_url, normalized=key)
+    
+    if audio_file:
+        play_music_only(str(audio_file), config)
+
+def run_play(query: str, config: dict, music_url: str = None, lyrics_url: str = None):
+    """Download music, fetch lyrics and play them in sync"""
+    song_title = sanitize_title(query)
+    key = title_key(song_title)
+    
+    # The download and the lyrics lookup are independent, so overlap them.
+    # The download stays on the main thread so Ctrl+C still stops yt-dlp.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        lyrics_future = executor.submit(fetch_lyrics, song_title, custom_url=lyrics_url, normalized=key)
+        audio_file = download_music(query, custom_url=music_url, normalized=key)
+        lyrics_content = lyrics_future.result()
+    
+    if not audio_file:
+        return
+    
+    if lyrics_content:
+        # Write the cache file while the lyrics are being parsed
+        saver = threading.Thread(target=save_lyrics, args=(song_title, lyrics_content), daemon=True)
+        saver.start()
+        lyrics = parse_lrc(lyrics_content)
+        saver.join()
+        if lyrics:
+            play_with_lyrics(audio_file, lyrics, config)
+        else:
+            print("⚠️  No synced lyrics available, playing music only")
+            play_music_only(audio_file, config)
+    else:
+        print("⚠️  No lyrics found, playing music only")
+        play_music_only(audio_file, config)
+
 # ============= INTERACTIVE MODE =============
 
-def interactive_mode():
-    """Interactive command-line mode"""
+def interactive_mode(config: Optional[dict] = None):
+    """Interactive command-line mode
+
+    Runs every command in this process, so the loaded config, the music
+    index and the lyrics/download session caches stay warm between songs.
+    """
+    if config is None:
+        config = load_config()
     clear_screen()
     print("=" * 60)
     print("🎵 LYRICS SHOWER - INTERACTIVE MODE")
@@ -802,18 +1262,17 @@ def interactive_mode():
             elif command in ['play', 'p']:
                 if args:
                     print(f"\nPlaying: {args}\n")
-                    # Execute play logic (simplified for interactive)
-                    os.system(f'python3 ~/bin/lyrics {args}')
+                    run_play(args, config)
                 else:
                     print("Please specify a song or set session song with 'set <song>'")
             elif command in ['lyrics', 'l']:
                 if args:
-                    os.system(f'python3 ~/bin/lyrics -l "{args}"')
+                    run_lyrics(args, config)
                 else:
                     print("Please specify a song")
             elif command in ['download', 'd']:
                 if args:
-                    os.system(f'python3 ~/bin/lyrics -m "{args}"')
+                    run_download(args, config)
                 else:
                     print("Please specify a song")
             elif command == 'list':
@@ -828,6 +1287,9 @@ def interactive_mode():
                     clear_cache('lyrics')
             elif command == 'settings':
                 settings_menu()
+                config = load_config()
+                # The media player may have changed
+                check_dependencies()
             else:
                 # Assume it's a song name
                 session_song = cmd
@@ -839,19 +1301,41 @@ def interactive_mode():
         except EOFError:
             print("\nGoodbye!")
             break
+        except Exception as e:
+            # A failed command (e.g. a missing yt-dlp or player) shouldn't end the session
+            print(f"❌ Error: {e}")
 
 # ============= MAIN FUNCTION =============
 
-def main():
-    global VERSION_WARNING
-    
-    # Check version
-    VERSION_WARNING = check_version()
-    
-    # Show version warning at start
-    if VERSION_WARNING:
-        print(VERSION_WARNING)
-    
+def print_version():
+    """Print version information"""
+    sys.stdout.write(VERSION_BANNER)
+
+# Mode flags each set args.command. Admin commands take no arguments and run
+# before the version check; management ones take the parsed args and run after it.
+ADMIN_COMMANDS = {
+    "version": print_version,
+    "update": update_lyrics_shower,
+    "uninstall": uninstall
+}
+
+# Admin flags that work on their own without the full argument parser
+FAST_COMMANDS = {
+    "-v": "version",
+    "--version": "version",
+    "--update": "update",
+    "--uninstall": "uninstall"
+}
+
+MANAGEMENT_COMMANDS = {
+    "settings": lambda args: settings_menu(),
+    "list": lambda args: list_cached(),
+    "clear_music": lambda args: clear_cache('music', args.clear_music or None),
+    "clear_lyrics": lambda args: clear_cache('lyrics', args.clear_lyrics or None)
+}
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command-line argument parser"""
     parser = argparse.ArgumentParser(
         description='Termux Lyrics Shower - Real-time synced lyrics with music playback',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -870,161 +1354,96 @@ Examples:
     )
     
     parser.add_argument('query', nargs='*', help='Song search query')
-    parser.add_argument('-l', '--lyrics', action='store_true', help='Fetch lyrics only without playing')
     parser.add_argument('-s', '--showcase', action='store_true', help='Show lyrics (use with -l)')
-    parser.add_argument('-p', '--play', action='store_true', help='Play music only (no lyrics)')
-    parser.add_argument('-m', '--music', action='store_true', help='Download music only and cache it')
-    parser.add_argument('-ls', '--list', action='store_true', help='List cached music and lyrics')
-    parser.add_argument('-cm', '--clear-music', nargs='?', const='', help='Delete cached music')
-    parser.add_argument('-cl', '--clear-lyrics', nargs='?', const='', help='Delete cached lyrics')
-    parser.add_argument('--settings', '--menu', action='store_true', help='Open settings menu')
     parser.add_argument('-e', '--effects', action='store_true', help='Toggle effects')
     parser.add_argument('-ext', '--external-url', help='Custom URL for music/lyrics')
     parser.add_argument('--music-url', help='Custom URL for music download')
     parser.add_argument('--lyrics-url', help='Custom URL for lyrics fetch')
-    parser.add_argument('--update', action='store_true', help='Update to latest version')
-    parser.add_argument('--uninstall', action='store_true', help='Uninstall lyrics shower')
-    parser.add_argument('-v', '--version', action='store_true', help='Show version information')
-    
-    args = parser.parse_args()
-    
-    # Handle version
-    if args.version:
-        print(f"Lyrics Shower v{CURRENT_VERSION['version']}")
-        print(f"Build: {CURRENT_VERSION['build']}")
-        print(f"Status: {CURRENT_VERSION['status']}")
-        print(f"Last Updated: {CURRENT_VERSION['last_updated']}")
-        return
-    
-    # Handle update
-    if args.update:
-        update_lyrics_shower()
-        return
-    
-    # Handle uninstall
-    if args.uninstall:
-        uninstall()
-        return
     
-    # Check dependencies
-    check_dependencies()
-    
-    # Load config
-    config = load_config()
-    
-    # Handle settings
-    if args.settings:
-        settings_menu()
-        if VERSION_WARNING:
-            print("\n" + VERSION_WARNING)
-        return
+    # Mutually exclusive modes, collapsed into a single args.command
+    modes = parser.add_mutually_exclusive_group()
+    mode_flags = [
+        (('-l', '--lyrics'), 'lyrics', 'Fetch lyrics only without playing'),
+        (('-p', '--play'), 'play', 'Play music only (no lyrics)'),
+        (('-m', '--music'), 'music', 'Download music only and cache it'),
+        (('-ls', '--list'), 'list', 'List cached music and lyrics'),
+        (('--settings', '--menu'), 'settings', 'Open settings menu'),
+        (('--update',), 'update', 'Update to latest version'),
+        (('--uninstall',), 'uninstall', 'Uninstall lyrics shower'),
+        (('-v', '--version'), 'version', 'Show version information')
+    ]
+    for flags, command, help_text in mode_flags:
+        modes.add_argument(*flags, action='store_const', dest='command', const=command, help=help_text)
+    modes.add_argument('-cm', '--clear-music', nargs='?', const='', help='Delete cached music')
+    modes.add_argument('-cl', '--clear-lyrics', nargs='?', const='', help='Delete cached lyrics')
+    return parser
+
+def main():
+    global VERSION_WARNING
     
-    # Handle list
-    if args.list:
-        list_cached()
-        if VERSION_WARNING:
-            print("\n" + VERSION_WARNING)
+    argv = sys.argv[1:]
+    if len(argv) == 1 and argv[0] in FAST_COMMANDS:
+        ADMIN_COMMANDS[FAST_COMMANDS[argv[0]]]()
         return
     
-    # Handle clear cache
+    args = build_parser().parse_args(argv)
     if args.clear_music is not None:
-        clear_cache('music', args.clear_music if args.clear_music else None)
-        if VERSION_WARNING:
-            print("\n" + VERSION_WARNING)
-        return
+        args.command = "clear_music"
+    elif args.clear_lyrics is not None:
+        args.command = "clear_lyrics"
     
-    if args.clear_lyrics is not None:
-        clear_cache('lyrics', args.clear_lyrics if args.clear_lyrics else None)
-        if VERSION_WARNING:
-            print("\n" + VERSION_WARNING)
+    # Handle version, update and uninstall
+    if args.command in ADMIN_COMMANDS:
+        ADMIN_COMMANDS[args.command]()
         return
     
-    # If no query and no special commands, enter interactive mode
-    if not args.query:
-        interactive_mode()
-        return
+    # Check version (the first network call, so it imports requests)
+    VERSION_WARNING = check_version()
+    
+    # Show version warning at start
+    if VERSION_WARNING:
+        print(VERSION_WARNING)
     
-    # Normal operation with query
-    query = ' '.join(args.query)
-    song_title = query.replace('/', '-').replace('\\', '-')
-    
-    # Handle external URLs
-    music_url = args.music_url or args.external_url
-    lyrics_url = args.lyrics_url or (args.external_url and f"{args.external_url.rsplit('.', 1)[0]}.lrc")
-    
-    # Lyrics only mode
-    if args.lyrics:
-        lyrics_content = load_cached_lyrics(song_title)
-        if not lyrics_content:
-            lyrics_content = fetch_lyrics(query, custom_url=lyrics_url)
-            if lyrics_content:
-                save_lyrics(song_title, lyrics_content)
+    try:
+        # Check dependencies
+        check_dependencies()
         
-        if lyrics_content:
-            if args.showcase:
-                showcase_lyrics(lyrics_content)
-            else:
-                print("✅ Lyrics fetched and cached")
-        else:
-            print("❌ No lyrics found")
+        # Load config
+        config = load_config()
         
-        if VERSION_WARNING:
-            print("\n" + VERSION_WARNING)
-        return
-    
-    # Music only mode
-    if args.music:
-        audio_file = download_music(query, custom_url=music_url)
-        if audio_file:
-            print("✅ Music downloaded and cached")
-        if VERSION_WARNING:
-            print("\n" + VERSION_WARNING)
-        return
-    
-    # Play only mode
-    if args.play:
-        # Check for cached music first
-        cached_files = list(MUSIC_DIR.glob(f"*{song_title}*.mp3"))
-        if not cached_files:
-            cached_files = list(MUSIC_DIR.glob("*.mp3"))
-            matches = fuzzy_search(song_title, [f.stem for f in cached_files])
-            if matches:
-                audio_file = MUSIC_DIR / f"{matches[0][0]}.mp3"
-            else:
-                audio_file = download_music(query, custom_url=music_url)
-        else:
-            audio_file = cached_files[0]
+        # Handle settings, list and clear cache
+        if args.command in MANAGEMENT_COMMANDS:
+            MANAGEMENT_COMMANDS[args.command](args)
+            return
         
-        if audio_file:
-            play_music_only(str(audio_file), config)
+        # If no query and no special commands, enter interactive mode
+        if not args.query:
+            interactive_mode(config)
+            return
         
+        # Normal operation with query
+        query = ' '.join(args.query)
+        
+        # Handle external URLs
+        music_url = args.music_url or args.external_url
+        lyrics_url = args.lyrics_url or derive_lrc_url(args.external_url)
+        
+        if args.command == "lyrics":
+            # Lyrics only mode
+            run_lyrics(query, config, showcase=args.showcase, lyrics_url=lyrics_url)
+        elif args.command == "music":
+            # Music only mode
+            run_download(query, config, music_url=music_url)
+        elif args.command == "play":
+            # Play only mode
+            run_play_music_only(query, config, music_url=music_url)
+        else:
+            # Full mode: download music + fetch lyrics + play
+            run_play(query, config, music_url=music_url, lyrics_url=lyrics_url)
+    finally:
+        # Show version warning at end
         if VERSION_WARNING:
             print("\n" + VERSION_WARNING)
-        return
-    
-    # Full mode: download music + fetch lyrics + play
-    audio_file = download_music(query, custom_url=music_url)
-    if not audio_file:
-        if VERSION_WARNING:
-            print("\n" + VERSION_WARNING)
-        return
-    
-    lyrics_content = fetch_lyrics(song_title, custom_url=lyrics_url)
-    if lyrics_content:
-        save_lyrics(song_title, lyrics_content)
-        lyrics = parse_lrc(lyrics_content)
-        if lyrics:
-            play_with_lyrics(audio_file, lyrics, config)
-        else:
-            print("⚠️  No synced lyrics available, playing music only")
-            play_music_only(audio_file, config)
-    else:
-        print("⚠️  No lyrics found, playing music only")
-        play_music_only(audio_file, config)
-    
-    # Show version warning at end
-    if VERSION_WARNING:
-        print("\n" + VERSION_WARNING)
 
 if __name__ == "__main__":
     main()